@@ -24,12 +24,110 @@ Usage:
 import pandas as pd
 import numpy as np
 from faker import Faker
-from datetime import datetime, timedelta
+from datetime import datetime
 import random
 from typing import List, Dict, Tuple, Optional
 import uuid
 import os
 
+try:
+    import polars as pl
+except ImportError:  # Polars is optional - frames are built and written with pandas directly
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # PyArrow is optional - only needed for Parquet output
+    pa = pq = None
+
+try:
+    from joblib import Parallel, delayed, parallel_config
+except ImportError:  # joblib is optional - transaction chunks are then generated sequentially
+    Parallel = delayed = parallel_config = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional - kernels fall back to plain Python loops
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+PARQUET_ROW_GROUP_SIZE = 262_144  # ~256k rows per Parquet row group
+
+# Fixed schema for streamed transaction files, so every chunk matches the file regardless of its contents
+TRANSACTION_SCHEMA = None if pa is None else pa.schema([
+    ('transaction_id', pa.string()),
+    ('account_id', pa.string()),
+    ('transaction_date', pa.timestamp('ms')),
+    ('transaction_type', pa.dictionary(pa.int8(), pa.string())),
+    ('amount', pa.float64()),
+    ('balance_after', pa.float64()),
+    ('merchant_name', pa.string()),
+    ('merchant_category', pa.dictionary(pa.int8(), pa.string())),
+    ('description', pa.string()),
+    ('status', pa.dictionary(pa.int8(), pa.string()))
+])
+
+
+# ============================================================================
+# JIT KERNELS
+# ============================================================================
+
+# Transaction type codes shared by the transaction kernel and generate_transactions
+TRANSACTION_TYPES = ['POS', 'ATM', 'Transfer', 'Online Payment', 'Direct Deposit',
+                     'Deposit', 'Withdrawal', 'Interest']
+CHECKING_TXN_CODES = np.array([0, 1, 2, 3, 4], dtype=np.int8)  # POS, ATM, Transfer, Online Payment, Direct Deposit
+OTHER_TXN_CODES = np.array([5, 6, 7, 2], dtype=np.int8)        # Deposit, Withdrawal, Interest, Transfer
+ATM_AMOUNTS = np.array([20.0, 40.0, 60.0, 80.0, 100.0])        # Typical ATM withdrawals
+
+
+@njit(parallel=True, cache=True)
+def _fill_transactions(offsets, is_checking, start_balance, checking_cdf, other_cdf,
+                       u_type, u_aux, u_overdraft, z, out_type, out_amount, out_balance):
+    """
+    Fill transaction type, amount and running balance for every account in parallel.
+    
+    Transactions of account i occupy rows offsets[i]:offsets[i + 1]. Accounts are
+    independent, but the overdraft check makes each account's rows sequential.
+    """
+    for i in prange(len(offsets) - 1):
+        running_balance = start_balance[i]
+        for j in range(offsets[i], offsets[i + 1]):
+            # Sample transaction type via binary search on the type CDF
+            if is_checking[i]:
+                k = min(np.searchsorted(checking_cdf, u_type[j], side='right'), len(checking_cdf) - 1)
+                code = CHECKING_TXN_CODES[k]
+            else:
+                k = min(np.searchsorted(other_cdf, u_type[j], side='right'), len(other_cdf) - 1)
+                code = OTHER_TXN_CODES[k]
+            
+            # Type-appropriate amount
+            if code == 4 or code == 5:
+                amount = abs(1500.0 + 1000.0 * z[j])                      # Larger deposits
+            elif code == 0:
+                amount = -np.exp(3.5 + 1.2 * z[j])                        # Log-normal for spending
+            elif code == 1:
+                amount = -ATM_AMOUNTS[min(int(u_aux[j] * 5), 4)]
+            elif code == 7:
+                amount = abs(50.0 + 20.0 * z[j])                          # Interest payments
+            else:
+                amount = 500.0 * z[j] * (1.0 if u_aux[j] < 0.5 else -1.0)  # Transfers
+            
+            # Balance management with overdraft limits
+            if running_balance + amount < -1000:  # Reasonable overdraft limit
+                amount = -running_balance + 100.0 * u_overdraft[j]  # Partial payment
+            
+            running_balance += amount
+            out_type[j] = code
+            out_amount[j] = amount
+            out_balance[j] = running_balance
+
+
 class BankingDataGenerator:
     """
     A comprehensive synthetic banking data generator that creates realistic financial datasets.
@@ -39,12 +137,34 @@ class BankingDataGenerator:
     
     Attributes:
         fake (Faker): Faker instance for generating realistic fake data
+        rng (np.random.Generator): NumPy generator used for all (vectorized) sampling
         customer_count (int): Number of customers to generate
         transaction_years (int): Number of years of transaction data
         start_date (datetime): Start date for transaction history
         end_date (datetime): End date for transaction history
     """
     
+    # Known domains of the low-cardinality columns, stored as pandas categoricals
+    ACCOUNT_TYPES = ['Checking', 'Savings', 'Money Market', 'CD']  # CD = Certificate of Deposit
+    ACCOUNT_STATUSES = ['Active', 'Dormant', 'Closed']
+    EMPLOYMENT_STATUSES = ['Employed', 'Self-Employed', 'Unemployed', 'Retired']
+    MERCHANT_CATEGORIES = ['Retail', 'Groceries', 'Dining', 'Utilities', 'Entertainment',
+                           'Travel', 'Healthcare', 'Education', 'Other']
+    TRANSACTION_STATUSES = ['Completed', 'Failed']
+    LOAN_TYPES = ['Mortgage', 'Auto', 'Personal', 'Student']
+    LOAN_STATUSES = ['Current', 'Delinquent', 'Paid Off']
+    CARD_TYPES = ['Visa', 'MasterCard', 'American Express']
+    CARD_STATUSES = ['Active', 'Inactive', 'Blocked']
+    
+    # Per-account-type parameters, indexed by the ACCOUNT_TYPES category code
+    ACCOUNT_BALANCE_MIN = np.array([0, 0, 0, 1000])                # Normal balance distribution (min, mean, std)
+    ACCOUNT_BALANCE_MEAN = np.array([5000, 15000, 25000, 10000])
+    ACCOUNT_BALANCE_STD = np.array([3000, 10000, 15000, 5000])
+    ACCOUNT_RATE_MIN = np.array([0.0001, 0.01, 0.02, 0.025])      # Interest rate range (Checking is flat near zero)
+    ACCOUNT_RATE_MAX = np.array([0.0001, 0.03, 0.04, 0.05])
+    ACCOUNT_TXN_FREQUENCY_MEAN = np.array([2, 0.3, 0.2, 0.05])     # Average daily transactions (mean, std)
+    ACCOUNT_TXN_FREQUENCY_STD = np.array([1, 0.2, 0.15, 0.03])
+    
     def __init__(self, seed: int = 42, customer_count: int = 5000, transaction_years: int = 2):
         """
         Initialize the data generator with configuration parameters.
@@ -57,8 +177,8 @@ class BankingDataGenerator:
         # Initialize Faker and set seeds for reproducibility
         self.fake = Faker()
         self.fake.seed_instance(seed)
-        np.random.seed(seed)
-        random.seed(seed)
+        random.seed(seed)  # Only kept for residual interop with libraries using the global random module
+        self.rng = np.random.default_rng(seed)  # Single PCG64 generator used for all sampling
         
         # Configuration parameters - REDUCED SCALE
         self.customer_count = customer_count  # Reduced to 5,000
@@ -79,6 +199,43 @@ class BankingDataGenerator:
             'Denver': (39.7392, -104.9903), 'Boston': (42.3601, -71.0589),
             'Atlanta': (33.7490, -84.3880), 'Miami': (25.7617, -80.1918)
         }
+        
+        # Struct-of-arrays view of the branch cities for vectorized branch generation
+        self._city_names = np.array(list(self.BRANCH_CITIES))
+        self._city_lat = np.array([lat for lat, _ in self.BRANCH_CITIES.values()])
+        self._city_lon = np.array([lon for _, lon in self.BRANCH_CITIES.values()])
+        
+        # Pre-built Faker pools so per-row "fake" columns become array lookups
+        FAKER_POOL_SIZE = 5_000
+        self._first_names = np.array([self.fake.first_name() for _ in range(FAKER_POOL_SIZE)])
+        self._last_names = np.array([self.fake.last_name() for _ in range(FAKER_POOL_SIZE)])
+        self._street_addresses = np.array([self.fake.street_address() for _ in range(FAKER_POOL_SIZE)])
+        self._cities = np.array([self.fake.city() for _ in range(FAKER_POOL_SIZE)])
+        self._states = np.array([self.fake.state_abbr() for _ in range(FAKER_POOL_SIZE)])
+        self.STATES = sorted(set(self._states))
+        self._zipcodes = np.array([self.fake.zipcode() for _ in range(20_000)])
+        self._merchants = np.array([self.fake.company() for _ in range(20_000)])
+        self._sentence_pool = np.array([self.fake.sentence(nb_words=6) for _ in range(10_000)])
+        
+        # Hourly transaction pattern (24-hour distribution)
+        self.HOURLY_PATTERN = [
+            0.01, 0.005, 0.002, 0.001, 0.001, 0.005, 0.02, 0.05,  # Overnight to morning
+            0.07, 0.06, 0.05, 0.06, 0.07, 0.06, 0.05, 0.06,       # Daytime
+            0.07, 0.08, 0.06, 0.04, 0.03, 0.02, 0.01, 0.005        # Evening to night
+        ]
+        
+        # Cumulative distributions for weighted sampling with np.searchsorted
+        self._hour_cdf = self._build_cdf(self.HOURLY_PATTERN)
+        self._agegroup_cdf = self._build_cdf([0.15, 0.25, 0.20, 0.15, 0.15, 0.10])  # 18-25, 26-35, 36-45, 46-55, 56-65, 65+
+        self._emp_cdf = self._build_cdf([0.6, 0.15, 0.1, 0.15])            # Employed, Self-Employed, Unemployed, Retired
+        self._acct_cdf = self._build_cdf([0.5, 0.3, 0.15, 0.05])           # Checking, Savings, Money Market, CD
+        self._acct_status_cdf = self._build_cdf([0.85, 0.1, 0.05])         # Active, Dormant, Closed
+        self._checking_txn_cdf = self._build_cdf([0.4, 0.2, 0.15, 0.2, 0.05])  # POS, ATM, Transfer, Online Payment, Direct Deposit
+        self._other_txn_cdf = self._build_cdf([0.4, 0.3, 0.2, 0.1])        # Deposit, Withdrawal, Interest, Transfer
+        self._txn_status_cdf = self._build_cdf([0.99, 0.01])               # Completed, Failed
+        self._loan_cdf = self._build_cdf([0.4, 0.3, 0.2, 0.1])             # Mortgage, Auto, Personal, Student
+        self._loan_status_cdf = self._build_cdf([0.85, 0.1, 0.05])         # Current, Delinquent, Paid Off
+        self._cc_status_cdf = self._build_cdf([0.9, 0.08, 0.02])           # Active, Inactive, Blocked
 
     # ============================================================================
     # BRANCH DATA GENERATION
@@ -96,24 +253,23 @@ class BankingDataGenerator:
                 - branch_id, branch_name, city, state, zip_code
                 - latitude, longitude, opening_date, total_deposits, employee_count
         """
-        branches = []
-        
-        for i, (city, coords) in enumerate(self.BRANCH_CITIES.items()):
-            branch = {
-                'branch_id': f'BR{i+1:04d}',
-                'branch_name': f'{city} Main Branch',
-                'city': city,
-                'state': self.fake.state_abbr(),
-                'zip_code': self.fake.zipcode(),
-                'latitude': coords[0] + random.uniform(-0.1, 0.1),  # Add slight variation
-                'longitude': coords[1] + random.uniform(-0.1, 0.1),
-                'opening_date': self.fake.date_between(start_date='-20y', end_date='-1y'),
-                'total_deposits': random.randint(50_000_000, 500_000_000),  # $50M-$500M range
-                'employee_count': random.randint(15, 100)
-            }
-            branches.append(branch)
-        
-        return pd.DataFrame(branches)
+        N = len(self._city_names)
+        rng = self.rng
+        today = np.datetime64('today', 'D')
+        
+        branches = self._build_frame({
+            'branch_id': self._sequential_ids('BR', N, 4),
+            'branch_name': np.char.add(self._city_names, ' Main Branch'),
+            'city': self._city_names,
+            'state': rng.choice(self._states, size=N),
+            'zip_code': rng.choice(self._zipcodes, size=N),
+            'latitude': self._city_lat + rng.uniform(-0.1, 0.1, N),  # Add slight variation
+            'longitude': self._city_lon + rng.uniform(-0.1, 0.1, N),
+            'opening_date': self._random_dates(today - np.timedelta64(7305, 'D'), today - np.timedelta64(365, 'D'), N),  # 1-20 years ago
+            'total_deposits': rng.integers(50_000_000, 500_000_000, N, endpoint=True, dtype=np.int32),  # $50M-$500M range
+            'employee_count': rng.integers(15, 100, N, endpoint=True, dtype=np.int16)
+        })
+        return self._to_categorical(branches, {'state': self.STATES})
 
     # ============================================================================
     # CUSTOMER DATA GENERATION
@@ -132,67 +288,72 @@ class BankingDataGenerator:
         Returns:
             pd.DataFrame: Customers data with demographic and financial attributes
         """
-        customers = []
+        N = self.customer_count
+        rng = self.rng
+        branch_ids = branch_df['branch_id'].to_numpy()  # Convert once, not per customer
         
-        # Realistic age distribution weights for US population
-        AGE_DISTRIBUTION = {
-            '18-25': 0.15, '26-35': 0.25, '36-45': 0.20,
-            '46-55': 0.15, '56-65': 0.15, '65+': 0.10
-        }
+        # Age group bounds: 18-25, 26-35, 36-45, 46-55, 56-65, 65+
+        AGE_MIN = np.array([18, 26, 36, 46, 56, 65])
+        AGE_MAX = np.array([25, 35, 45, 55, 65, 90])
         
         # Age-appropriate income ranges (annual, in USD)
-        INCOME_RANGES = {
-            '18-25': (20_000, 60_000), '26-35': (35_000, 90_000),
-            '36-45': (50_000, 150_000), '46-55': (60_000, 180_000),
-            '56-65': (55_000, 160_000), '65+': (30_000, 100_000)
-        }
-        
-        for i in range(self.customer_count):
-            # Select age group based on realistic distribution
-            age_group = random.choices(
-                list(AGE_DISTRIBUTION.keys()), 
-                weights=list(AGE_DISTRIBUTION.values())
-            )[0]
-            
-            # Calculate age and birth date
-            if '+' in age_group:
-                min_age, max_age = 65, 90
-            else:
-                min_age, max_age = map(int, age_group.split('-'))
-                
-            age = random.randint(min_age, max_age)
-            birth_date = datetime.now() - timedelta(days=age * 365 + random.randint(0, 364))
-            
-            # Generate income based on age group with normal distribution
-            min_inc, max_inc = INCOME_RANGES[age_group]
-            income = random.normalvariate((min_inc + max_inc) / 2, (max_inc - min_inc) / 4)
-            income = max(min_inc, min(max_inc, income))  # Clip to range
-            
-            # Create customer profile
-            customer = {
-                'customer_id': f'CUST{i+1:06d}',
-                'first_name': self.fake.first_name(),
-                'last_name': self.fake.last_name(),
-                'email': self.fake.email(),
-                'phone': self.fake.phone_number(),
-                'address': self.fake.street_address(),
-                'city': self.fake.city(),
-                'state': self.fake.state_abbr(),
-                'zip_code': self.fake.zipcode(),
-                'date_of_birth': birth_date.date(),
-                'ssn': self.fake.ssn().replace('-', ''),  # Remove dashes for consistency
-                'customer_since': self.fake.date_between(start_date='-10y', end_date='today'),
-                'credit_score': max(300, min(850, int(random.normalvariate(700, 100)))),
-                'annual_income': int(income),
-                'employment_status': random.choices(
-                    ['Employed', 'Self-Employed', 'Unemployed', 'Retired'],
-                    weights=[0.6, 0.15, 0.1, 0.15]  # Realistic employment distribution
-                )[0],
-                'branch_id': random.choice(branch_df['branch_id'].tolist())
-            }
-            customers.append(customer)
-        
-        return pd.DataFrame(customers)
+        INCOME_MIN = np.array([20_000, 35_000, 50_000, 60_000, 55_000, 30_000])
+        INCOME_MAX = np.array([60_000, 90_000, 150_000, 180_000, 160_000, 100_000])
+        
+        # Select age groups based on realistic US population distribution (one draw per column)
+        age_group_idx = self._sample_cdf(self._agegroup_cdf, N, self.rng)
+        
+        # Calculate ages and birth dates
+        ages = rng.integers(AGE_MIN[age_group_idx], AGE_MAX[age_group_idx] + 1)
+        birth_offsets = rng.integers(0, 365, N)
+        birth_dates = (pd.Timestamp.now() - pd.to_timedelta(ages * 365 + birth_offsets, unit='D')).normalize()
+        
+        # Generate income based on age group with normal distribution, clipped to range
+        min_inc = INCOME_MIN[age_group_idx]
+        max_inc = INCOME_MAX[age_group_idx]
+        income = rng.normal((min_inc + max_inc) / 2, (max_inc - min_inc) / 4).clip(min_inc, max_inc)
+        
+        credit_score = rng.normal(700, 100, N).clip(300, 850).astype(np.int16)
+        employment = np.array(self.EMPLOYMENT_STATUSES)[self._sample_cdf(self._emp_cdf, N, self.rng)]  # Realistic employment distribution
+        branch_id = rng.choice(branch_ids, N)
+        customer_id = self._sequential_ids('CUST', N, 6)
+        
+        # Identity fields are sampled from the pre-built Faker pools
+        first_name = rng.choice(self._first_names, size=N)
+        last_name = rng.choice(self._last_names, size=N)
+        email = np.char.add(
+            np.char.add(np.char.lower(first_name), '.'),
+            np.char.add(np.char.lower(last_name), '@example.com')
+        )
+        phone = np.char.add(
+            np.char.add(self._random_digits(N, 3), '-'),
+            np.char.add(np.char.add(self._random_digits(N, 3), '-'), self._random_digits(N, 4))
+        )
+        today = np.datetime64('today', 'D')
+        customer_since = self._random_dates(today - np.timedelta64(3652, 'D'), today, N)  # Last 10 years
+        
+        customers = self._build_frame({
+            'customer_id': customer_id,
+            'first_name': first_name,
+            'last_name': last_name,
+            'email': email,
+            'phone': phone,
+            'address': rng.choice(self._street_addresses, size=N),
+            'city': rng.choice(self._cities, size=N),
+            'state': rng.choice(self._states, size=N),
+            'zip_code': rng.choice(self._zipcodes, size=N),
+            'date_of_birth': birth_dates,
+            'ssn': self._random_digits(N, 9),
+            'customer_since': customer_since,
+            'credit_score': credit_score,
+            'annual_income': income.astype(np.int32),
+            'employment_status': employment,
+            'branch_id': branch_id
+        })
+        return self._to_categorical(customers, {
+            'state': self.STATES,
+            'employment_status': self.EMPLOYMENT_STATUSES
+        })
 
     # ============================================================================
     # ACCOUNT DATA GENERATION
@@ -211,64 +372,41 @@ class BankingDataGenerator:
         Returns:
             pd.DataFrame: Accounts data with financial attributes and status
         """
-        accounts = []
-        account_counter = 1
+        rng = self.rng
         
-        for _, customer in customer_df.iterrows():
-            # Customers have 1-4 accounts on average (exponential distribution)
-            num_accounts = max(1, int(random.expovariate(1/1.5)))
-            
-            for _ in range(num_accounts):
-                # Account type distribution (Checking most common)
-                account_type = random.choices(
-                    ['Checking', 'Savings', 'Money Market', 'CD'],  # Certificate of Deposit
-                    weights=[0.5, 0.3, 0.15, 0.05]  # Realistic distribution
-                )[0]
-                
-                # Type-appropriate balance ranges (normal distribution)
-                balance_ranges = {
-                    'Checking': (0, 5000, 3000),    # (min, mean, std)
-                    'Savings': (0, 15000, 10000),
-                    'Money Market': (0, 25000, 15000),
-                    'CD': (1000, 10000, 5000)
-                }
-                
-                min_bal, mean_bal, std_bal = balance_ranges[account_type]
-                balance = max(min_bal, random.normalvariate(mean_bal, std_bal))
-                
-                # Convert customer_since to date object if needed
-                customer_since = self._ensure_date(customer['customer_since'])
-                
-                account = {
-                    'account_id': f'ACC{account_counter:06d}',
-                    'customer_id': customer['customer_id'],
-                    'account_type': account_type,
-                    'account_number': ''.join([str(random.randint(0, 9)) for _ in range(12)]),
-                    'current_balance': round(balance, 2),
-                    'open_date': self.fake.date_between(start_date=customer_since, end_date='today'),
-                    'interest_rate': self._get_interest_rate(account_type),
-                    'status': random.choices(['Active', 'Dormant', 'Closed'], 
-                                           weights=[0.85, 0.1, 0.05])[0]  # Status distribution
-                }
-                accounts.append(account)
-                account_counter += 1
-        
-        return pd.DataFrame(accounts)
-    
-    def _get_interest_rate(self, account_type: str) -> float:
-        """Get realistic interest rate based on account type."""
-        rates = {
-            'Checking': 0.0001,    # Near zero
-            'Savings': (0.01, 0.03),
-            'Money Market': (0.02, 0.04),
-            'CD': (0.025, 0.05)
-        }
+        # Customers have 1-4 accounts on average (exponential distribution)
+        counts = np.maximum(1, rng.exponential(1.5, len(customer_df)).astype(int))
+        total = int(counts.sum())
         
-        if account_type == 'Checking':
-            return rates['Checking']
-        else:
-            min_rate, max_rate = rates[account_type]
-            return round(random.uniform(min_rate, max_rate), 4)
+        # Expand customer attributes to one row per account
+        customer_ids = np.repeat(customer_df['customer_id'].to_numpy(), counts)
+        customer_since = np.repeat(
+            np.asarray(customer_df['customer_since'].to_numpy(), dtype='datetime64[D]'), counts
+        )
+        
+        # Account type distribution (Checking most common)
+        type_idx = self._sample_cdf(self._acct_cdf, total, self.rng)
+        # Type-appropriate balances and interest rates via per-type lookup arrays
+        balance = np.maximum(
+            self.ACCOUNT_BALANCE_MIN[type_idx],
+            rng.normal(self.ACCOUNT_BALANCE_MEAN[type_idx], self.ACCOUNT_BALANCE_STD[type_idx])
+        )
+        interest_rate = rng.uniform(self.ACCOUNT_RATE_MIN[type_idx], self.ACCOUNT_RATE_MAX[type_idx]).round(4)
+        
+        accounts = self._build_frame({
+            'account_id': self._sequential_ids('ACC', total, 6),
+            'customer_id': customer_ids,
+            'account_type': np.array(self.ACCOUNT_TYPES)[type_idx],
+            'account_number': self._random_digits(total, 12),
+            'current_balance': balance.round(2),
+            'open_date': self._random_dates(customer_since, np.datetime64('today', 'D')),
+            'interest_rate': interest_rate,
+            'status': np.array(self.ACCOUNT_STATUSES)[self._sample_cdf(self._acct_status_cdf, total, self.rng)]
+        })
+        return self._to_categorical(accounts, {
+            'account_type': self.ACCOUNT_TYPES,
+            'status': self.ACCOUNT_STATUSES
+        })
 
     # ============================================================================
     # TRANSACTION DATA GENERATION
@@ -291,155 +429,189 @@ class BankingDataGenerator:
         Returns:
             pd.DataFrame: Transactions data with temporal and financial attributes
         """
-        transactions = []
-        transaction_id = 1
+        return pd.concat(list(self._iter_transaction_chunks(account_df)), ignore_index=True)
+    
+    def write_transactions(self, account_df: pd.DataFrame, filename: str) -> int:
+        """
+        Generate transactions and stream them straight to a Snappy-compressed Parquet file.
         
-        # Hourly transaction pattern (24-hour distribution)
-        HOURLY_PATTERN = [
-            0.01, 0.005, 0.002, 0.001, 0.001, 0.005, 0.02, 0.05,  # Overnight to morning
-            0.07, 0.06, 0.05, 0.06, 0.07, 0.06, 0.05, 0.06,       # Daytime
-            0.07, 0.08, 0.06, 0.04, 0.03, 0.02, 0.01, 0.005        # Evening to night
-        ]
+        Each chunk of accounts is written as soon as it is generated, so peak memory is
+        bounded by the chunk size instead of the full transaction table.
+        
+        Args:
+            account_df (pd.DataFrame): Accounts data for transaction-account relationships
+            filename (str): Path of the Parquet file to write
+            
+        Returns:
+            int: Number of transactions written
+        """
+        if pq is None:
+            raise ImportError("pyarrow is required to write transactions as Parquet")
+        
+        total = 0
+        with pq.ParquetWriter(filename, TRANSACTION_SCHEMA, compression='snappy') as writer:
+            for chunk in self._iter_transaction_chunks(account_df):
+                if len(chunk) == 0:
+                    continue  # Only happens without active accounts - the file keeps just the schema
+                writer.write_table(
+                    pa.Table.from_pandas(chunk, schema=TRANSACTION_SCHEMA, preserve_index=False),
+                    row_group_size=PARQUET_ROW_GROUP_SIZE
+                )
+                total += len(chunk)
+        return total
+    
+    def _iter_transaction_chunks(self, account_df: pd.DataFrame):
+        """Yield the transactions table as consecutive, fully formatted chunks in account order."""
+        rng = self.rng
         
         # Transaction frequency reduction factor to limit total transactions
         # We'll reduce frequency by 60% to keep under 1M transactions
         FREQUENCY_REDUCTION_FACTOR = 0.4
-        
-        for _, account in account_df.iterrows():
-            if account['status'] != 'Active':
-                continue  # Skip inactive accounts
-                
-            # Calculate account activity period
-            account_open_date = self._ensure_date(account['open_date'])
-            days_active = (self.end_date.date() - account_open_date).days
-            
-            if days_active <= 0:
-                continue  # Account opened after our end date
-                
-            # Transaction frequency based on account type - REDUCED by factor
-            txn_frequency = self._get_transaction_frequency(account['account_type']) * FREQUENCY_REDUCTION_FACTOR
-            total_expected_txns = int(days_active * txn_frequency)
-            actual_txns = max(1, int(random.normalvariate(total_expected_txns, total_expected_txns * 0.1)))
-            
-            # Simulate transaction history with running balance
-            current_balance = account['current_balance']
-            running_balance = current_balance
-            
-            for _ in range(actual_txns):
-                # Random transaction date within account lifetime
-                days_ago = random.randint(0, days_active)
-                transaction_date = self._create_transaction_datetime(account_open_date, days_ago, HOURLY_PATTERN)
-                
-                # Generate transaction details
-                txn_details = self._generate_transaction_details(account['account_type'])
-                amount = txn_details['amount']
-                
-                # Balance management with overdraft limits
-                if running_balance + amount < -1000:  # Reasonable overdraft limit
-                    amount = -running_balance + random.uniform(0, 100)  # Partial payment
-                
-                running_balance += amount
-                
-                transaction = {
-                    'transaction_id': f'TXN{transaction_id:08d}',
-                    'account_id': account['account_id'],
-                    'transaction_date': transaction_date,
-                    'transaction_type': txn_details['type'],
-                    'amount': round(amount, 2),
-                    'balance_after': round(running_balance, 2),
-                    'merchant_name': txn_details['merchant'],
-                    'merchant_category': txn_details['category'],
-                    'description': txn_details['description'],
-                    'status': 'Completed' if random.random() > 0.01 else 'Failed'  # 1% failure rate
-                }
-                
-                transactions.append(transaction)
-                transaction_id += 1
-        
-        # Ensure we don't exceed 1M transactions
-        if len(transactions) > 1_000_000:
-            transactions = transactions[:1_000_000]
-            print(f"⚠️  Transactions capped at 1,000,000 records")
-        
-        return pd.DataFrame(transactions)
-    
-    def _get_transaction_frequency(self, account_type: str) -> float:
-        """Get average daily transactions based on account type."""
-        frequencies = {
-            'Checking': (2, 1),   # (mean, std) - Higher frequency
-            'Savings': (0.3, 0.2),
-            'Money Market': (0.2, 0.15),
-            'CD': (0.05, 0.03)    # Very low frequency
-        }
-        mean, std = frequencies[account_type]
-        return max(0.01, random.normalvariate(mean, std))
-    
-    def _create_transaction_datetime(self, base_date: datetime, days_ago: int, hourly_pattern: List[float]) -> datetime:
-        """Create realistic transaction datetime with temporal patterns."""
-        transaction_date = datetime.combine(base_date + timedelta(days=days_ago), datetime.min.time())
-        hour = random.choices(range(24), weights=hourly_pattern)[0]
-        return transaction_date.replace(
-            hour=hour, 
-            minute=random.randint(0, 59),
-            second=random.randint(0, 59)
+        MAX_TRANSACTIONS = 1_000_000
+        TRANSACTION_CHUNK_ROWS = 100_000  # Approximate transactions per parallel work item
+        
+        # Only active accounts opened before our end date generate transactions
+        open_dates = np.asarray(account_df['open_date'].to_numpy(), dtype='datetime64[D]')
+        days_active = (np.datetime64(self.end_date.date(), 'D') - open_dates).astype(np.int64)
+        active = (account_df['status'] == 'Active').to_numpy() & (days_active > 0)
+        accounts = account_df[active]
+        open_dates, days_active = open_dates[active], days_active[active]
+        type_idx = pd.Categorical(accounts['account_type'], categories=self.ACCOUNT_TYPES).codes  # int8 type codes
+        
+        # Transaction counts per account based on account type - REDUCED by factor
+        txn_frequency = np.maximum(
+            0.01, rng.normal(self.ACCOUNT_TXN_FREQUENCY_MEAN[type_idx], self.ACCOUNT_TXN_FREQUENCY_STD[type_idx])
         )
-    
-    def _generate_transaction_details(self, account_type: str) -> Dict:
-        """Generate realistic transaction details based on account type."""
-        if account_type == 'Checking':
-            # Checking accounts have diverse transaction types
-            txn_types = ['POS', 'ATM', 'Transfer', 'Online Payment', 'Direct Deposit']
-            weights = [0.4, 0.2, 0.15, 0.2, 0.05]
+        total_expected_txns = (days_active * txn_frequency * FREQUENCY_REDUCTION_FACTOR).astype(np.int64)
+        counts = np.maximum(1, rng.normal(total_expected_txns, total_expected_txns * 0.1).astype(np.int64))
+        
+        # Ensure we don't exceed 1M transactions (keep the first 1M in account order)
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        if offsets[-1] > MAX_TRANSACTIONS:
+            offsets = np.minimum(offsets, MAX_TRANSACTIONS)
+            print(f"⚠️  Transactions capped at {MAX_TRANSACTIONS:,} records")
+        counts = np.diff(offsets)
+        
+        # Accounts past the cap have no transactions left, so they are never chunked
+        has_txns = counts > 0
+        accounts, counts = accounts[has_txns], counts[has_txns]
+        open_dates, days_active, type_idx = open_dates[has_txns], days_active[has_txns], type_idx[has_txns]
+        
+        # Accounts are independent, so runs of accounts holding ~TRANSACTION_CHUNK_ROWS transactions are
+        # generated in parallel workers. Chunking by transaction count (not CPU count) bounds the memory of
+        # each chunk and keeps the output identical on every machine.
+        chunk_of_account = (np.cumsum(counts) - counts) // TRANSACTION_CHUNK_ROWS
+        chunks = np.split(np.arange(len(accounts)), np.flatnonzero(np.diff(chunk_of_account)) + 1)
+        seeds = rng.integers(0, 2**32, size=len(chunks))
+        # Workers only receive plain arrays and pools, never the generator itself (Faker, customer pools)
+        pools = (self._merchants, self._sentence_pool, self._checking_txn_cdf, self._other_txn_cdf,
+                 self._hour_cdf, self._txn_status_cdf)
+        tasks = [
+            (
+                np.random.default_rng(seed), accounts['account_id'].to_numpy()[idx], open_dates[idx], days_active[idx],
+                type_idx[idx] == self.ACCOUNT_TYPES.index('Checking'), accounts['current_balance'].to_numpy(dtype=np.float64)[idx],
+                counts[idx], *pools
+            )
+            for idx, seed in zip(chunks, seeds)
+        ]
+        if Parallel is None or len(tasks) == 1:
+            results = (self._generate_transaction_chunk(*task) for task in tasks)
         else:
-            # Savings-like accounts have simpler transaction patterns
-            txn_types = ['Deposit', 'Withdrawal', 'Interest', 'Transfer']
-            weights = [0.4, 0.3, 0.2, 0.1]
-        
-        txn_type = random.choices(txn_types, weights=weights)[0]
-        
-        # Generate type-appropriate amount
-        amount = self._generate_transaction_amount(txn_type, account_type)
+            # Split the cores between workers and the Numba threads inside each worker to avoid oversubscription
+            n_jobs = min(len(tasks), os.cpu_count() or 1)
+            with parallel_config(backend='loky', inner_max_num_threads=max(1, (os.cpu_count() or 1) // n_jobs)):
+                results = Parallel(n_jobs=n_jobs, return_as='generator')(
+                    delayed(self._generate_transaction_chunk)(*task) for task in tasks
+                )
+        
+        # Number transactions continuously across chunks as they arrive (in submission order)
+        next_id = 1
+        for chunk in results:
+            chunk.insert(0, 'transaction_id', self._sequential_ids('TXN', len(chunk), 8, start=next_id))
+            next_id += len(chunk)
+            yield self._to_categorical(chunk, {
+                'transaction_type': TRANSACTION_TYPES,
+                'merchant_category': self.MERCHANT_CATEGORIES,
+                'status': self.TRANSACTION_STATUSES
+            })
+    
+    @staticmethod
+    def _generate_transaction_chunk(rng: np.random.Generator, account_ids: np.ndarray, open_dates: np.ndarray,
+                                    days_active: np.ndarray, is_checking: np.ndarray, start_balance: np.ndarray,
+                                    counts: np.ndarray, merchant_pool: np.ndarray, sentence_pool: np.ndarray,
+                                    checking_cdf: np.ndarray, other_cdf: np.ndarray, hour_cdf: np.ndarray,
+                                    status_cdf: np.ndarray) -> pd.DataFrame:
+        """Generate the transactions of one chunk of accounts using the chunk's own seeded generator."""
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        T = int(offsets[-1])
+        
+        # Pre-draw every random input from the seeded generator so the parallel kernel is reproducible
+        u_type, u_aux, u_overdraft = rng.random(T), rng.random(T), rng.random(T)
+        z = rng.standard_normal(T)
+        
+        # Type, amount and running balance are filled per account by the JIT kernel
+        out_type = np.empty(T, dtype=np.int8)
+        out_amount = np.empty(T, dtype=np.float64)
+        out_balance = np.empty(T, dtype=np.float64)
+        _fill_transactions(
+            offsets, is_checking, start_balance,
+            checking_cdf, other_cdf, u_type, u_aux, u_overdraft, z,
+            out_type, out_amount, out_balance
+        )
+        txn_types = np.array(TRANSACTION_TYPES)[out_type]
         
-        # Generate merchant details for POS transactions
-        merchant, category, description = self._generate_merchant_details(txn_type)
+        # Random transaction dates within each account's lifetime
+        days_ago = rng.integers(0, np.repeat(days_active, counts) + 1)
+        transaction_dates = BankingDataGenerator._create_transaction_datetime(
+            np.repeat(open_dates, counts), days_ago, hour_cdf, rng
+        )
         
-        return {
-            'type': txn_type,
-            'amount': amount,
-            'merchant': merchant,
-            'category': category,
-            'description': description
-        }
-    
-    def _generate_transaction_amount(self, txn_type: str, account_type: str) -> float:
-        """Generate realistic transaction amounts based on type."""
-        if txn_type in ['Direct Deposit', 'Deposit']:
-            return abs(random.normalvariate(1500, 1000))  # Larger deposits
-        elif txn_type == 'POS':
-            return -abs(random.lognormvariate(3.5, 1.2))  # Log-normal for spending
-        elif txn_type == 'ATM':
-            return -random.choice([20, 40, 60, 80, 100])  # Typical ATM withdrawals
-        elif txn_type == 'Interest':
-            return abs(random.normalvariate(50, 20))      # Interest payments
-        else:
-            return random.normalvariate(0, 500) * random.choice([-1, 1])  # Transfers
-    
-    def _generate_merchant_details(self, txn_type: str) -> Tuple[Optional[str], Optional[str], str]:
-        """Generate merchant information for transaction descriptions."""
-        if txn_type == 'POS':
-            categories = ['Retail', 'Groceries', 'Dining', 'Utilities', 'Entertainment', 
-                         'Travel', 'Healthcare', 'Education', 'Other']
-            return (
-                self.fake.company(),
-                random.choice(categories),
-                self.fake.sentence(nb_words=6)
-            )
-        elif txn_type == 'ATM':
-            return (None, None, 'ATM Withdrawal')
-        elif txn_type == 'Interest':
-            return (None, None, 'Interest Payment')
-        else:
-            return (None, None, self.fake.sentence(nb_words=6))
+        # Merchant details only exist for POS transactions, sampled from the merchant pool
+        pos = out_type == TRANSACTION_TYPES.index('POS')
+        n_pos = int(pos.sum())
+        pos_merchants = merchant_pool[rng.integers(0, len(merchant_pool), n_pos)]
+        merchants = np.full(T, None, dtype=object)
+        merchants[pos] = pos_merchants
+        categories = np.full(T, None, dtype=object)
+        merchant_categories = BankingDataGenerator.MERCHANT_CATEGORIES
+        categories[pos] = np.array(merchant_categories)[rng.integers(0, len(merchant_categories), n_pos)]
+        
+        # Templated descriptions for POS, fixed ones for ATM and interest, pooled sentences otherwise
+        atm = out_type == TRANSACTION_TYPES.index('ATM')
+        interest = out_type == TRANSACTION_TYPES.index('Interest')
+        free_text = ~(pos | atm | interest)
+        descriptions = np.full(T, None, dtype=object)
+        descriptions[pos] = np.char.add(pos_merchants, ' - purchase')
+        descriptions[atm] = 'ATM Withdrawal'
+        descriptions[interest] = 'Interest Payment'
+        descriptions[free_text] = sentence_pool[rng.integers(0, len(sentence_pool), int(free_text.sum()))]
+        
+        return BankingDataGenerator._build_frame({
+            'account_id': np.repeat(account_ids, counts),
+            'transaction_date': transaction_dates,
+            'transaction_type': txn_types,
+            'amount': out_amount.round(2),
+            'balance_after': out_balance.round(2),
+            'merchant_name': merchants,
+            'merchant_category': categories,
+            'description': descriptions,
+            'status': np.array(BankingDataGenerator.TRANSACTION_STATUSES)[
+                BankingDataGenerator._sample_cdf(status_cdf, T, rng)
+            ]  # 1% failure rate
+        })
+    
+    @staticmethod
+    def _create_transaction_datetime(base_dates: np.ndarray, days_ago: np.ndarray, hour_cdf: np.ndarray,
+                                     rng: np.random.Generator) -> np.ndarray:
+        """Create realistic transaction datetimes with temporal patterns as a datetime64[s] array."""
+        n = len(base_dates)
+        hours = BankingDataGenerator._sample_cdf(hour_cdf, n, rng)
+        seconds_of_day = hours * 3600 + rng.integers(0, 3600, n)  # Random minute and second within the hour
+        return (
+            np.asarray(base_dates, dtype='datetime64[D]')
+            + np.asarray(days_ago).astype('timedelta64[D]')
+            + seconds_of_day.astype('timedelta64[s]')
+        )
 
     # ============================================================================
     # LOAN DATA GENERATION
@@ -458,72 +630,55 @@ class BankingDataGenerator:
         Returns:
             pd.DataFrame: Loans data with financial terms and status
         """
-        loans = []
+        rng = self.rng
+        
+        # Loan parameters by type: Mortgage, Auto, Personal, Student
+        AMOUNT_MIN = np.array([100_000, 10_000, 5_000, 10_000])    # $100K / $10K / $5K / $10K
+        AMOUNT_MAX = np.array([500_000, 50_000, 50_000, 100_000])  # $500K / $50K / $50K / $100K
+        RATE_MIN = np.array([0.03, 0.04, 0.06, 0.04])              # 3% / 4% / 6% / 4%
+        RATE_MAX = np.array([0.06, 0.08, 0.12, 0.08])              # 6% / 8% / 12% / 8%
+        
+        # Allowed terms in months, padded per type (15-30y, 3-6y, 1-5y, 10-20y)
+        TERM_CHOICES = np.array([
+            [180, 240, 360, 0, 0],
+            [36, 48, 60, 72, 0],
+            [12, 24, 36, 48, 60],
+            [120, 180, 240, 0, 0]
+        ], dtype=np.int16)
+        TERM_COUNTS = np.array([3, 4, 5, 3])
         
         # 30% of customers have loans (realistic penetration)
-        loan_customers = customer_df.sample(frac=0.3)
-        
-        for i, (_, customer) in enumerate(loan_customers.iterrows()):
-            loan_type = random.choices(
-                ['Mortgage', 'Auto', 'Personal', 'Student'],
-                weights=[0.4, 0.3, 0.2, 0.1]  # Mortgage most common
-            )[0]
-            
-            # Loan parameters based on type
-            loan_terms = self._get_loan_parameters(loan_type)
-            amount = loan_terms['amount']
-            term = loan_terms['term']
-            interest_rate = loan_terms['rate']
-            
-            # Calculate monthly payment using amortization formula
-            monthly_rate = interest_rate / 12
-            monthly_payment = amount * (monthly_rate * (1 + monthly_rate) ** term) / ((1 + monthly_rate) ** term - 1)
-            
+        customer_ids, customer_since = self._sample_customers(customer_df, 0.3)
+        N = len(customer_ids)
+        
+        # Loan type distribution (Mortgage most common) and type-based parameters
+        type_idx = self._sample_cdf(self._loan_cdf, N, self.rng)
+        amount = rng.integers(AMOUNT_MIN[type_idx], AMOUNT_MAX[type_idx], endpoint=True, dtype=np.int32)
+        term = TERM_CHOICES[type_idx, rng.integers(0, TERM_COUNTS[type_idx])]
+        interest_rate = rng.uniform(RATE_MIN[type_idx], RATE_MAX[type_idx])
+        
+        # Calculate monthly payments using the amortization formula
+        monthly_rate = interest_rate / 12
+        growth = np.power(1 + monthly_rate, term)
+        monthly_payment = amount * monthly_rate * growth / (growth - 1)
+        
+        loans = self._build_frame({
+            'loan_id': self._sequential_ids('LOAN', N, 6),
+            'customer_id': customer_ids,
+            'loan_type': np.array(self.LOAN_TYPES)[type_idx],
+            'loan_amount': amount,
+            'interest_rate': interest_rate.round(4),
+            'term_months': term,
             # Loan dates relative to customer relationship
-            customer_since = self._ensure_date(customer['customer_since'])
-            loan_date = self.fake.date_between(start_date=customer_since, end_date='today')
-            
-            loans.append({
-                'loan_id': f'LOAN{i+1:06d}',
-                'customer_id': customer['customer_id'],
-                'loan_type': loan_type,
-                'loan_amount': amount,
-                'interest_rate': round(interest_rate, 4),
-                'term_months': term,
-                'start_date': loan_date,
-                'monthly_payment': round(monthly_payment, 2),
-                'remaining_balance': round(amount * random.uniform(0.1, 0.9), 2),  # Some paid off
-                'status': random.choices(['Current', 'Delinquent', 'Paid Off'], 
-                                       weights=[0.85, 0.1, 0.05])[0]  # Status distribution
-            })
-        
-        return pd.DataFrame(loans)
-    
-    def _get_loan_parameters(self, loan_type: str) -> Dict:
-        """Get realistic loan parameters based on loan type."""
-        parameters = {
-            'Mortgage': {
-                'amount': random.randint(100_000, 500_000),  # $100K-$500K
-                'term': random.choice([180, 240, 360]),      # 15, 20, 30 years
-                'rate': random.uniform(0.03, 0.06)           # 3-6%
-            },
-            'Auto': {
-                'amount': random.randint(10_000, 50_000),    # $10K-$50K
-                'term': random.choice([36, 48, 60, 72]),     # 3-6 years
-                'rate': random.uniform(0.04, 0.08)           # 4-8%
-            },
-            'Personal': {
-                'amount': random.randint(5_000, 50_000),     # $5K-$50K
-                'term': random.choice([12, 24, 36, 48, 60]), # 1-5 years
-                'rate': random.uniform(0.06, 0.12)           # 6-12%
-            },
-            'Student': {
-                'amount': random.randint(10_000, 100_000),   # $10K-$100K
-                'term': random.choice([120, 180, 240]),      # 10-20 years
-                'rate': random.uniform(0.04, 0.08)           # 4-8%
-            }
-        }
-        return parameters[loan_type]
+            'start_date': self._random_dates(customer_since, np.datetime64('today', 'D')),
+            'monthly_payment': monthly_payment.round(2),
+            'remaining_balance': (amount * rng.uniform(0.1, 0.9, N)).round(2),  # Some paid off
+            'status': np.array(self.LOAN_STATUSES)[self._sample_cdf(self._loan_status_cdf, N, self.rng)]
+        })
+        return self._to_categorical(loans, {
+            'loan_type': self.LOAN_TYPES,
+            'status': self.LOAN_STATUSES
+        })
 
     # ============================================================================
     # CREDIT CARD DATA GENERATION
@@ -542,46 +697,103 @@ class BankingDataGenerator:
         Returns:
             pd.DataFrame: Credit cards data with financial attributes
         """
-        cards = []
+        rng = self.rng
+        today = np.datetime64('today', 'D')
         
         # 60% of customers have credit cards (realistic penetration)
-        card_customers = customer_df.sample(frac=0.6)
-        
-        for i, (_, customer) in enumerate(card_customers.iterrows()):
-            # Realistic credit limit distribution
-            credit_limit = max(1000, min(50_000, int(random.normalvariate(8000, 4000))))
-            current_balance = random.randint(0, int(credit_limit * 0.8))  # 0-80% utilization
-            
-            customer_since = self._ensure_date(customer['customer_since'])
-            
-            cards.append({
-                'card_id': f'CARD{i+1:06d}',
-                'customer_id': customer['customer_id'],
-                'card_number': ''.join([str(random.randint(0, 9)) for _ in range(16)]),
-                'expiry_date': self.fake.date_between(start_date='today', end_date='+5y'),
-                'credit_limit': credit_limit,
-                'current_balance': current_balance,
-                'available_credit': credit_limit - current_balance,
-                'issue_date': self.fake.date_between(start_date=customer_since, end_date='today'),
-                'card_type': random.choice(['Visa', 'MasterCard', 'American Express']),
-                'status': random.choices(['Active', 'Inactive', 'Blocked'], 
-                                       weights=[0.9, 0.08, 0.02])[0]  # Status distribution
-            })
-        
-        return pd.DataFrame(cards)
+        customer_ids, customer_since = self._sample_customers(customer_df, 0.6)
+        N = len(customer_ids)
+        
+        # Realistic credit limit distribution with 0-80% utilization
+        credit_limit = rng.normal(8000, 4000, N).clip(1000, 50_000).astype(np.int32)
+        current_balance = rng.integers(0, (credit_limit * 0.8).astype(np.int32), endpoint=True, dtype=np.int32)
+        
+        cards = self._build_frame({
+            'card_id': self._sequential_ids('CARD', N, 6),
+            'customer_id': customer_ids,
+            'card_number': self._random_digits(N, 16),
+            'expiry_date': self._random_dates(today, today + np.timedelta64(1826, 'D'), N),  # Next 5 years
+            'credit_limit': credit_limit,
+            'current_balance': current_balance,
+            'available_credit': credit_limit - current_balance,
+            'issue_date': self._random_dates(customer_since, today),
+            'card_type': np.array(self.CARD_TYPES)[rng.integers(0, len(self.CARD_TYPES), N)],
+            'status': np.array(self.CARD_STATUSES)[self._sample_cdf(self._cc_status_cdf, N, self.rng)]  # Status distribution
+        })
+        return self._to_categorical(cards, {
+            'card_type': self.CARD_TYPES,
+            'status': self.CARD_STATUSES
+        })
 
     # ============================================================================
     # UTILITY METHODS
     # ============================================================================
     
-    def _ensure_date(self, date_value) -> datetime.date:
-        """Convert string date to date object if necessary."""
-        if isinstance(date_value, str):
-            return datetime.strptime(date_value, '%Y-%m-%d').date()
-        return date_value
+    @staticmethod
+    def _build_frame(data: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """
+        Build a pandas DataFrame from column arrays, going through Polars when available.
+        
+        Polars assembles the columns natively and hands them to pandas via Arrow,
+        avoiding pandas' slower per-column inference on large inputs.
+        """
+        if pl is None:
+            return pd.DataFrame(data)
+        return pl.DataFrame({name: BankingDataGenerator._polars_column(values) for name, values in data.items()}).to_pandas()
+    
+    @staticmethod
+    def _polars_column(values):
+        """Adapt a NumPy column to a form Polars can ingest with a native dtype."""
+        if not isinstance(values, np.ndarray):
+            return values
+        if values.dtype == 'datetime64[s]':
+            return values.astype('datetime64[ms]')  # Polars accepts day or sub-second resolution only
+        if values.dtype == object:
+            return values.tolist()  # Object arrays would otherwise become opaque pl.Object columns
+        return values
+    
+    def _sample_customers(self, customer_df: pd.DataFrame, fraction: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample a fraction of customers without replacement, returning only their IDs and customer_since dates."""
+        idx = self.rng.choice(len(customer_df), round(len(customer_df) * fraction), replace=False)
+        return customer_df['customer_id'].to_numpy()[idx], customer_df['customer_since'].to_numpy()[idx]
+    
+    @staticmethod
+    def _to_categorical(df: pd.DataFrame, categories: Dict[str, List[str]]) -> pd.DataFrame:
+        """Store known-domain string columns as pandas categoricals (small integer codes + dictionary)."""
+        for column, values in categories.items():
+            df[column] = pd.Categorical(df[column], categories=values)
+        return df
+    
+    @staticmethod
+    def _build_cdf(weights: List[float]) -> np.ndarray:
+        """Convert sampling weights to a normalized cumulative distribution."""
+        cdf = np.cumsum(weights, dtype=np.float64)
+        return cdf / cdf[-1]
+    
+    @staticmethod
+    def _sample_cdf(cdf: np.ndarray, size: int, rng: np.random.Generator) -> np.ndarray:
+        """Draw category indices from a precomputed CDF via binary search."""
+        return np.searchsorted(cdf, rng.random(size), side='right')
+    
+    @staticmethod
+    def _sequential_ids(prefix: str, n: int, width: int, start: int = 1) -> np.ndarray:
+        """Generate prefixed, zero-padded sequential IDs (e.g. ACC000001) for a whole column at once."""
+        return np.char.mod(f'{prefix}%0{width}d', np.arange(start, start + n))
+    
+    def _random_digits(self, n: int, length: int) -> np.ndarray:
+        """Generate n random fixed-width digit strings (e.g. SSNs, phone groups) in one pass."""
+        digits = self.rng.integers(0, 10, (n, length), dtype=np.uint8) + ord('0')
+        return digits.view(f'S{length}').ravel().astype(f'U{length}')
+    
+    def _random_dates(self, start, end, size: Optional[int] = None) -> np.ndarray:
+        """Draw uniformly distributed dates between start and end (inclusive) as datetime64[D]."""
+        start = np.asarray(start, dtype='datetime64[D]')
+        end = np.asarray(end, dtype='datetime64[D]')
+        span_days = np.maximum((end - start).astype(np.int64), 0)
+        return start + self.rng.integers(0, span_days + 1, size=size)
 
 
-def generate_complete_dataset() -> Dict[str, pd.DataFrame]:
+def generate_complete_dataset(transactions_file: Optional[str] = None) -> Dict[str, pd.DataFrame]:
     """
     Generate complete banking dataset with all interconnected tables.
     
@@ -593,6 +805,10 @@ def generate_complete_dataset() -> Dict[str, pd.DataFrame]:
     5. Loans (depends on customers)
     6. Credit Cards (depends on customers)
     
+    Args:
+        transactions_file (Optional[str]): If given, transactions are streamed to this Parquet
+            file chunk by chunk instead of being held in memory, and are left out of the result
+    
     Returns:
         Dict[str, pd.DataFrame]: Dictionary of DataFrames for each table
     """
@@ -614,7 +830,12 @@ def generate_complete_dataset() -> Dict[str, pd.DataFrame]:
     accounts = generator.generate_accounts(customers)
     
     print("💰 Generating transactions (this may take a moment)...")
-    transactions = generator.generate_transactions(accounts)
+    if transactions_file is None:
+        transactions = generator.generate_transactions(accounts)
+    else:
+        os.makedirs(os.path.dirname(transactions_file) or '.', exist_ok=True)
+        n_transactions = generator.write_transactions(accounts, transactions_file)
+        print(f"   📄 {transactions_file} - {n_transactions:,} records")
     
     print("🏠 Generating loans...")
     loans = generator.generate_loans(customers)
@@ -625,30 +846,62 @@ def generate_complete_dataset() -> Dict[str, pd.DataFrame]:
     print("✅ Data generation completed successfully!")
     print("=" * 60)
     
-    return {
-        'branches': branches,
-        'customers': customers,
-        'accounts': accounts,
-        'transactions': transactions,
-        'loans': loans,
-        'credit_cards': credit_cards
-    }
+    data = {'branches': branches, 'customers': customers, 'accounts': accounts}
+    if transactions_file is None:
+        data['transactions'] = transactions
+    data.update(loans=loans, credit_cards=credit_cards)
+    return data
+
+
+def _write_csv(df: pd.DataFrame, filename: str) -> None:
+    """Write a DataFrame to CSV, using the Polars writer when available."""
+    if pl is None:
+        df.to_csv(filename, index=False)
+        return
+    
+    frame = pl.from_pandas(df)
+    # Match pandas output: datetime columns holding only midnights are written as plain dates
+    frame = frame.with_columns(
+        pl.col(name).cast(pl.Date)
+        for name, dtype in frame.schema.items()
+        if isinstance(dtype, pl.Datetime) and (frame[name].dt.truncate('1d') == frame[name]).all()
+    )
+    frame.write_csv(filename, datetime_format='%Y-%m-%d %H:%M:%S')
+
 
+def _write_parquet(df: pd.DataFrame, filename: str) -> None:
+    """Write a DataFrame to a Snappy-compressed Parquet file."""
+    if pq is None:
+        raise ImportError("pyarrow is required to save datasets as Parquet")
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=False), filename,
+        compression='snappy', row_group_size=PARQUET_ROW_GROUP_SIZE
+    )
 
-def save_datasets(data_dict: Dict[str, pd.DataFrame], output_path: str = 'banking_data/') -> None:
+
+def save_datasets(data_dict: Dict[str, pd.DataFrame], output_path: str = 'banking_data/',
+                  file_format: str = 'csv') -> None:
     """
-    Save all generated datasets to CSV files for persistent storage.
+    Save all generated datasets to CSV or Parquet files for persistent storage.
+    
+    CSV remains the default because the bronze layer loads the files with BULK INSERT.
+    Parquet output is much smaller and faster to write for large transaction tables.
     
     Args:
         data_dict (Dict[str, pd.DataFrame]): Dictionary of DataFrames to save
-        output_path (str): Directory path for saving CSV files
+        output_path (str): Directory path for saving the files
+        file_format (str): Output format, either 'csv' or 'parquet'
     """
+    writers = {'csv': _write_csv, 'parquet': _write_parquet}
+    if file_format not in writers:
+        raise ValueError(f"Unsupported file format '{file_format}', expected one of {list(writers)}")
+    
     os.makedirs(output_path, exist_ok=True)
     
     print(f"💾 Saving datasets to {output_path}...")
     for name, df in data_dict.items():
-        filename = f"{output_path}/{name}.csv"
-        df.to_csv(filename, index=False)
+        filename = f"{output_path}/{name}.{file_format}"
+        writers[file_format](df, filename)
         print(f"   📄 {filename} - {len(df):,} records")
     
     print("✅ All datasets saved successfully!")
@@ -704,12 +957,17 @@ if __name__ == "__main__":
     When run as a script, this generates the complete dataset, saves it to CSV files,
     and displays a comprehensive summary.
     """
+    OUTPUT_PATH = 'finbank_data/'
+    FILE_FORMAT = 'csv'  # 'parquet' also streams transactions to disk instead of holding them in memory
+    
     try:
         # Generate complete dataset
-        banking_data = generate_complete_dataset()
+        banking_data = generate_complete_dataset(
+            transactions_file=f"{OUTPUT_PATH}/transactions.parquet" if FILE_FORMAT == 'parquet' else None
+        )
         
-        # Save to CSV files
-        save_datasets(banking_data, 'finbank_data/')
+        # Save to CSV (or Parquet) files
+        save_datasets(banking_data, OUTPUT_PATH, FILE_FORMAT)
         
         # Display summary
         generate_dataset_summary(banking_data)